@@ -64,6 +64,7 @@ from .const import (
 from .coordinator import MareesFranceUpdateCoordinator
 from .frontend import JSModuleRegistration
 from .api_helpers import (
+    get_cached_store,
     _async_fetch_and_store_water_level,
     _async_fetch_and_store_tides,
     _async_fetch_and_store_coefficients,
@@ -869,8 +870,8 @@ async def async_check_and_prefetch_water_levels(
         ", ".join(missing_dates),
     )
 
+    websession = async_get_clientsession(hass)
     for i, date_str in enumerate(missing_dates):
-        websession = async_get_clientsession(hass)
         await _async_fetch_and_store_water_level(
             hass, store, cache, harbor_id, date_str, websession=websession
         )
@@ -1374,16 +1375,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """
     _LOGGER.debug("Marées France: Setting up Marées France entry: %s", entry.entry_id)
 
-    water_level_store = Store[dict[str, dict[str, Any]]](
+    # The coordinator reloads these stores every update cycle; cache their content.
+    # One instance per storage key is shared by all entries.
+    water_level_store = get_cached_store(
         hass, WATERLEVELS_STORAGE_VERSION, WATERLEVELS_STORAGE_KEY
     )
-    tides_store = Store[dict[str, dict[str, Any]]](
-        hass, TIDES_STORAGE_VERSION, TIDES_STORAGE_KEY
-    )
-    coeff_store = Store[dict[str, dict[str, Any]]](
-        hass, COEFF_STORAGE_VERSION, COEFF_STORAGE_KEY
-    )
-    watertemp_store = Store[dict[str, dict[str, Any]]](
+    tides_store = get_cached_store(hass, TIDES_STORAGE_VERSION, TIDES_STORAGE_KEY)
+    coeff_store = get_cached_store(hass, COEFF_STORAGE_VERSION, COEFF_STORAGE_KEY)
+    watertemp_store = get_cached_store(
         hass, WATERTEMP_STORAGE_VERSION, WATERTEMP_STORAGE_KEY
     )
 
@@ -1500,7 +1499,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def _daily_water_level_prefetch_job(*_: Any) -> None:
         _LOGGER.debug("Marées France: Running daily water level prefetch job.")
-        await async_check_and_prefetch_water_levels(hass, entry, water_level_store)
+        async with water_level_store.lock:
+            await async_check_and_prefetch_water_levels(hass, entry, water_level_store)
 
     rand_wl_hour = random.randint(1, 5)
     rand_wl_min = random.randint(0, 59)
@@ -1521,7 +1521,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def _daily_tides_prefetch_job(*_: Any) -> None:
         _LOGGER.debug("Marées France: Running daily tides prefetch job.")
-        await async_check_and_prefetch_tides(hass, entry, tides_store)
+        async with tides_store.lock:
+            await async_check_and_prefetch_tides(hass, entry, tides_store)
 
     rand_t_hour = random.randint(1, 5)
     rand_t_min = random.randint(0, 59)
@@ -1545,7 +1546,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     async def _daily_coefficients_prefetch_job(*_: Any) -> None:
         _LOGGER.debug("Marées France: Running daily coefficients prefetch job.")
         try:
-            await async_check_and_prefetch_coefficients(hass, entry, coeff_store)
+            async with coeff_store.lock:
+                await async_check_and_prefetch_coefficients(hass, entry, coeff_store)
             _LOGGER.debug("Marées France: Coefficients check done.")
         except Exception:
             _LOGGER.exception(
@@ -1584,7 +1586,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         """Run daily job to prefetch water temperature data."""
         _LOGGER.debug("Marées France: Running daily water temperature prefetch job.")
         try:
-            await async_check_and_prefetch_watertemp(hass, entry, watertemp_store)
+            async with watertemp_store.lock:
+                await async_check_and_prefetch_watertemp(hass, entry, watertemp_store)
         except Exception as e:
             _LOGGER.exception(
                 "Marées France: Error during scheduled water temperature prefetch job: %s",
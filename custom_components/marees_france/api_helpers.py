@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import logging
 import asyncio
+import os
 from datetime import date, timedelta
-from typing import Any
+from typing import Any, TypeVar
 
 import aiohttp
 
@@ -21,10 +22,125 @@ from .const import (
     WATERTEMP_URL_TEMPLATE,
     DATE_FORMAT,
     API_REQUEST_DELAY,
+    DOMAIN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# hass.data key of the CachedStore instances shared by all config entries.
+_CACHED_STORES_KEY = f"{DOMAIN}_cached_stores"
+
+
+class CachedStore(Store[_T]):
+    """Store that keeps its last loaded data in memory.
+
+    `async_load` only re-reads and re-parses the JSON file when its
+    modification time or size changed since the previous load or save, so
+    repeated loads of an unchanged store cost a single `stat()` call. Other
+    Store instances writing the same file (e.g. services) are picked up
+    through that check.
+
+    Every load returns a fresh copy of the top-level dict and of its dict
+    values (harbor -> date -> data). Callers only add, replace or delete
+    entries at those two levels, so they can mutate what they load without
+    touching the cached data; only `async_save` changes it. Leaf values are
+    shared and must not be mutated in place.
+
+    Use `get_cached_store` to get the instance shared by all config entries;
+    code that loads, changes and saves the store holds `lock` meanwhile.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the store with an empty in-memory cache."""
+        super().__init__(*args, **kwargs)
+        self._cached_stat: tuple[int, int] | None = None
+        self._cached_data: _T | None = None
+        self._written_stat: tuple[int, int] | None = None
+        self._version = 0
+        # Serializes read-modify-write cycles (repairs, prefetches) on the store.
+        self.lock = asyncio.Lock()
+
+    @property
+    def cache_version(self) -> int:
+        """Counter bumped every time the data is re-read from disk or saved."""
+        return self._version
+
+    @staticmethod
+    def _copy(data: _T | None) -> _T | None:
+        """Return a copy of the top two dict levels of `data`."""
+        if not isinstance(data, dict):
+            return data
+        return {  # type: ignore[return-value]
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in data.items()
+        }
+
+    def _stat_file(self) -> tuple[int, int] | None:
+        """Return (mtime_ns, size) of the backing file, or None if missing."""
+        try:
+            stat_result = os.stat(self.path)
+        except OSError:
+            return None
+        return stat_result.st_mtime_ns, stat_result.st_size
+
+    def _write_data(self, path: str, data: dict) -> None:
+        """Write the data and stat the file within the same executor job."""
+        super()._write_data(path, data)
+        self._written_stat = self._stat_file()
+
+    async def async_load(self) -> _T | None:
+        """Load data, skipping the JSON parse when the file is unchanged."""
+        data, _ = await self.async_load_versioned()
+        return data
+
+    async def async_load_versioned(self) -> tuple[_T | None, int]:
+        """Load data along with the `cache_version` it was loaded at.
+
+        Reading `cache_version` after the load is not enough, as a save may
+        have bumped it in the meantime.
+        """
+        file_stat = await self.hass.async_add_executor_job(self._stat_file)
+        if file_stat is not None and file_stat == self._cached_stat:
+            return self._copy(self._cached_data), self._version
+
+        data = await super().async_load()
+        self._cached_stat = file_stat
+        self._cached_data = data
+        self._version += 1
+        return self._copy(data), self._version
+
+    async def async_save(self, data: _T) -> None:
+        """Save data and remember it as the current file content."""
+        self._cached_stat = None
+        self._written_stat = None
+        await super().async_save(data)
+        self._cached_stat = self._written_stat
+        self._cached_data = self._copy(data)
+        self._version += 1
+
+
+def get_cached_store(
+    hass: HomeAssistant, version: int, key: str
+) -> CachedStore[dict[str, dict[str, Any]]]:
+    """Return the CachedStore for `key`, shared by all config entries.
+
+    Args:
+        hass: The Home Assistant instance.
+        version: The storage version of the store.
+        key: The storage key of the store.
+
+    Returns:
+        The CachedStore instance, created on first use.
+    """
+    stores: dict[str, CachedStore[dict[str, dict[str, Any]]]] = hass.data.setdefault(
+        _CACHED_STORES_KEY, {}
+    )
+    if key not in stores:
+        stores[key] = CachedStore[dict[str, dict[str, Any]]](hass, version, key)
+    return stores[key]
+
 
 async def _async_fetch_with_retry(
     session: aiohttp.ClientSession,
@@ -92,6 +92,9 @@ ATTR_FINISHED_HEIGHT: Final[str] = (
 )
 ATTR_STARTING_TIME: Final[str] = "starting_time"  # Attribute for tide starting time
 ATTR_FINISHED_TIME: Final[str] = "finished_time"  # Attribute for tide finished time
+ATTR_FINISHED_TIME_DT: Final[str] = (
+    "finished_time_dt"  # Parsed finished time for sensor states, not an attribute
+)
 ATTR_CURRENT_HEIGHT: Final[str] = "current_height"  # Attribute for current water height
 ATTR_WATER_TEMP: Final[str] = "water_temp"
 
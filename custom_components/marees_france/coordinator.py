@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
+from array import array
+import asyncio
+import bisect
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 import logging
 from typing import Any, Callable, Coroutine, TypeVar, cast
+from zoneinfo import ZoneInfo
 
 import aiohttp
-import pytz
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.storage import Store
-from homeassistant.helpers.translation import async_get_translations
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -21,6 +24,7 @@ from .const import (
     ATTR_CURRENT_HEIGHT,
     ATTR_FINISHED_HEIGHT,
     ATTR_FINISHED_TIME,
+    ATTR_FINISHED_TIME_DT,
     ATTR_STARTING_HEIGHT,
     ATTR_STARTING_TIME,
     ATTR_TIDE_TREND,
@@ -28,16 +32,14 @@ from .const import (
     CONF_HARBOR_ID,
     CONF_HARBOR_LAT,
     CONF_HARBOR_LON,
-    DATE_FORMAT,
     DOMAIN,
     NEAP_TIDE_THRESHOLD,
     SPRING_TIDE_THRESHOLD,
-    STATE_HIGH_TIDE,
-    STATE_LOW_TIDE,
     TIDE_HIGH,
     TIDE_LOW,
 )
 from .api_helpers import (
+    CachedStore,
     _async_fetch_and_store_water_level,
     _async_fetch_and_store_tides,
     _async_fetch_and_store_coefficients,
@@ -49,6 +51,110 @@ _LOGGER = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+def _is_valid_list_entry(_date_key: str, daily_data: Any) -> bool:
+    """Tides and coefficients cache entries: a list of items per date."""
+    return isinstance(daily_data, list)
+
+
+def _is_valid_water_levels_entry(date_key: str, daily_data: Any) -> bool:
+    """Water levels cache entries: the API payload, `{date: [[time, height], ...]}`."""
+    return isinstance(daily_data, dict) and isinstance(daily_data.get(date_key), list)
+
+
+def _is_valid_watertemp_entry(_date_key: str, daily_data: Any) -> bool:
+    """Water temperature cache entries: a list of forecast dicts per date."""
+    return isinstance(daily_data, list) and all(
+        isinstance(item, dict) for item in daily_data
+    )
+
+
+def _filter_date_range(
+    harbor_cache: dict[str, Any], date_range: tuple[str, str] | None
+) -> dict[str, Any]:
+    """Return the entries whose ISO date key lies within the inclusive range."""
+    if not date_range:
+        return {}
+    first, last = date_range
+    return {
+        date_key: daily_data
+        for date_key, daily_data in harbor_cache.items()
+        if first <= date_key <= last
+    }
+
+
+async def _async_load_versioned(
+    store: Store[dict[str, dict[str, Any]]],
+) -> tuple[dict[str, dict[str, Any]], int | None]:
+    """Load `store` along with its cache version, None for a plain Store."""
+    if isinstance(store, CachedStore):
+        data, cache_version = await store.async_load_versioned()
+        return data or {}, cache_version
+    return await store.async_load() or {}, None
+
+
+def _daily_max_coefficients(coeff_raw_data: dict[str, Any]) -> dict[str, int]:
+    """Return the highest numeric coefficient of each date that has one."""
+    daily_max: dict[str, int] = {}
+    for day_str, day_coeffs in coeff_raw_data.items():
+        if not day_coeffs or not isinstance(day_coeffs, list):
+            continue
+        try:
+            max_coeff = max(
+                (int(c) for c in day_coeffs if isinstance(c, str) and c.isdigit()),
+                default=None,
+            )
+        except (ValueError, TypeError):
+            _LOGGER.warning(
+                "Marées France Coordinator: Error processing daily coefficients "
+                "for %s: %s",
+                day_str,
+                day_coeffs,
+            )
+            continue
+        if max_coeff is not None:
+            daily_max[day_str] = max_coeff
+    return daily_max
+
+
+def _find_special_tides(
+    max_coeffs: list[int], start: int, spring_threshold: int, neap_threshold: int
+) -> tuple[int, int]:
+    """Return the indexes of the first spring and neap tide days from `start`.
+
+    Both searches share a single pass, -1 means no such day in the calendar.
+    """
+    spring_index = neap_index = -1
+    for index in range(start, len(max_coeffs)):
+        max_coeff = max_coeffs[index]
+        if spring_index == -1 and max_coeff >= spring_threshold:
+            spring_index = index
+        if neap_index == -1 and max_coeff <= neap_threshold:
+            neap_index = index
+        if spring_index != -1 and neap_index != -1:
+            break
+    return spring_index, neap_index
+
+
+# The next spring/neap dates only change daily, parse them once.
+_parse_iso_date = lru_cache(maxsize=8)(date.fromisoformat)
+
+
+# Per data type check of a single `date -> daily data` cache entry, and the
+# expected shape reported when it fails.
+_CACHE_ENTRY_VALIDATORS: dict[str, tuple[Callable[[str, Any], bool], str]] = {
+    "tides": (_is_valid_list_entry, "list"),
+    "coefficients": (_is_valid_list_entry, "list"),
+    "water_levels": (
+        _is_valid_water_levels_entry,
+        "dict with a list under its date key",
+    ),
+    "watertemp": (_is_valid_watertemp_entry, "list of dicts"),
+}
+
+# Tide types with dots converted to underscores for the frontend.
+_TRANSLATED_TYPE: dict[str, str] = {TIDE_HIGH: "tide_high", TIDE_LOW: "tide_low"}
+
+
 class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Manages fetching, caching, and processing of Marées France data.
 
@@ -90,6 +196,27 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.water_level_store = water_level_store
         self.watertemp_store = watertemp_store
         self.websession = websession or async_get_clientsession(hass)
+        self._cache_lock = asyncio.Lock()
+        self._tide_timeline: tuple[list[dict[str, Any]], list[int]] | None = None
+        self._tide_timeline_source: tuple[Any, Any] | None = None
+        # data_type -> (store version, date range, window) of the last cache
+        # that passed validation.
+        self._validated_caches: dict[
+            str, tuple[int, tuple[str, str] | None, dict[str, Any]]
+        ] = {}
+        # (coefficient window, highest coefficient per date, sorted dates, their
+        # highest coefficients), rebuilt when the window changes.
+        self._coeff_calendar: (
+            tuple[dict[str, Any], dict[str, int], list[str], list[int]] | None
+        ) = None
+        # (calendar maxima, first index, spring index, neap index) of the last
+        # spring/neap search, -1 when there is no such day.
+        self._special_tide_indexes: tuple[list[int], int, int, int] | None = None
+        # (date, source samples, seconds since midnight, heights) of the last
+        # water level samples, sorted by time for bisection.
+        self._water_levels_cache: (
+            tuple[str, list[list[str]], array[int], list[str]] | None
+        ) = None
 
         update_interval = timedelta(minutes=5)  # Frequent updates for water levels
 
@@ -100,13 +227,19 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=update_interval,
         )
 
-    async def prune_watertemp_cache(self) -> None:
-        """Remove water temperature entries older than today."""
+    def prune_watertemp_cache(self, cache: dict[str, dict[str, Any]]) -> bool:
+        """Remove water temperature entries older than today.
+
+        Args:
+            cache: The full water temperature cache, pruned in place.
+
+        Returns:
+            True if entries were removed and the cache needs saving.
+        """
         try:
-            cache = await self.watertemp_store.async_load() or {}
             harbor_cache = cache.get(self.harbor_id)
             if not harbor_cache:
-                return
+                return False
 
             today = date.today()
             keys_to_prune = [
@@ -115,26 +248,29 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 if date.fromisoformat(key.split("T")[0]) < today
             ]
 
-            if keys_to_prune:
-                for key in keys_to_prune:
-                    del harbor_cache[key]
-                await self.watertemp_store.async_save(cache)
-                _LOGGER.debug(
-                    "Marées France Coordinator: Pruned %d old water temperature entries for %s",
-                    len(keys_to_prune),
-                    self.harbor_id,
-                )
+            if not keys_to_prune:
+                return False
+            for key in keys_to_prune:
+                del harbor_cache[key]
+            _LOGGER.debug(
+                "Marées France Coordinator: Pruned %d old water temperature entries for %s",
+                len(keys_to_prune),
+                self.harbor_id,
+            )
+            return True
         except Exception as e:
             _LOGGER.exception(
                 "Marées France Coordinator: Error pruning water temperature cache for %s: %s",
                 self.harbor_id,
                 e,
             )
+            return False
 
     async def _validate_and_repair_cache(
         self,
         store: Store[dict[str, dict[str, Any]]],
         cache_full: dict[str, dict[str, Any]],
+        cache_version: int | None,
         data_type: str,
         fetch_function: Callable[
             [
@@ -148,16 +284,26 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             Coroutine[Any, Any, bool | dict[str, Any] | None],
         ],
         fetch_args: tuple[Any, ...],
-    ) -> tuple[dict[str, dict[str, Any]], dict[str, Any]]:
+        dirty_stores: dict[
+            Store[dict[str, dict[str, Any]]],
+            Callable[[dict[str, dict[str, Any]]], bool],
+        ],
+        date_range: tuple[str, str] | None = None,
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, Any], dict[str, Any]]:
         """Validate cache for the harbor, repair if needed, and return caches.
 
         Checks if the cache for the specific harbor and data type is present and
         has a valid basic structure. If not, it attempts to clear the invalid
-        entry and re-fetch the data using the provided `fetch_function`.
+        entry and re-fetch the data using the provided `fetch_function`. The
+        repair holds the store lock and first reloads the store, so a repair
+        finished by another update or a prefetch in the meantime is reused.
+        Entries within `date_range` are collected during the same pass.
 
         Args:
             store: The data store instance (tides, coefficients, or water levels).
             cache_full: The entire cache dictionary loaded from the store.
+            cache_version: The store's cache version `cache_full` was loaded at,
+                           None if the store does not keep one.
             data_type: A string identifying the type of data ("tides",
                        "coefficients", "water_levels").
             fetch_function: The async function to call to re-fetch data if repair
@@ -165,91 +311,75 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             fetch_args: A tuple of arguments to pass to the `fetch_function`
                         (excluding hass, store, cache_full, harbor_id which are
                         passed automatically).
+            dirty_stores: The stores mutated during this update and the mutation
+                          to re-apply to their latest data when saving them at
+                          the end of the cache stage.
+            date_range: Optional inclusive (first, last) ISO date bounds of the
+                        entries to return as the date window.
 
         Returns:
             A tuple containing:
                 - The (potentially modified) full cache dictionary.
                 - The harbor-specific cache dictionary (potentially re-fetched).
+                - The harbor entries within `date_range` (empty without a range).
         """
         harbor_cache = cache_full.get(self.harbor_id, {})
-        needs_repair = False
 
-        if not isinstance(harbor_cache, dict):
-            _LOGGER.warning(
-                "Marées France Coordinator: Invalid cache format for %s harbor '%s': "
-                "Expected dict, got %s.",
-                data_type,
-                self.harbor_id,
-                type(harbor_cache).__name__,
-            )
-            needs_repair = True
-        elif (
-            not harbor_cache and data_type != "water_levels"
-        ):  # Allow empty water_levels initially
-            _LOGGER.warning(
-                "Marées France Coordinator: Empty %s cache entry found for harbor '%s'.",
-                data_type,
-                self.harbor_id,
-            )
-            needs_repair = True
-        else:
-            # Specific validation for data structures within the harbor_cache
-            if data_type == "water_levels":
-                for date_key, daily_data in harbor_cache.items():
-                    if (
-                        not isinstance(daily_data, dict)
-                        or date_key not in daily_data
-                        or not isinstance(daily_data.get(date_key), list)
-                    ):
-                        _LOGGER.warning(
-                            "Marées France Coordinator: Invalid %s cache structure for "
-                            "harbor '%s', date '%s'.",
-                            data_type,
-                            self.harbor_id,
-                            date_key,
-                        )
-                        needs_repair = True
-                        break
-            elif data_type == "watertemp":
-                for date_key, daily_data in harbor_cache.items():
-                    if not isinstance(daily_data, list) or not all(
-                        isinstance(item, dict) for item in daily_data
-                    ):
-                        _LOGGER.warning(
-                            "Marées France Coordinator: Invalid %s cache data for harbor '%s', "
-                            "date '%s': Expected list of dicts, got %s.",
-                            data_type,
-                            self.harbor_id,
-                            date_key,
-                            type(daily_data).__name__,
-                        )
-                        needs_repair = True
-                        break
-            else:  # Tides and Coefficients expect a list of items per date
-                for date_key, daily_data in harbor_cache.items():
-                    if not isinstance(daily_data, list):
-                        _LOGGER.warning(
-                            "Marées France Coordinator: Invalid %s cache data for harbor '%s', "
-                            "date '%s': Expected list, got %s.",
-                            data_type,
-                            self.harbor_id,
-                            date_key,
-                            type(daily_data).__name__,
-                        )
-                        needs_repair = True
-                        break
+        # Steady state: the cached store was neither re-read nor saved since this
+        # data passed validation on a previous update.
+        if cache_version is not None:
+            validated = self._validated_caches.get(data_type)
+            if validated is not None and validated[0] == cache_version:
+                if validated[1] != date_range:
+                    validated = (
+                        cache_version,
+                        date_range,
+                        _filter_date_range(harbor_cache, date_range),
+                    )
+                    self._validated_caches[data_type] = validated
+                return cache_full, harbor_cache, validated[2]
 
-        if needs_repair:
-            _LOGGER.warning(
-                "Marées France Coordinator: Invalid or empty %s cache detected "
-                "for %s. Attempting repair.",
-                data_type,
-                self.harbor_id,
-            )
+        window = self._check_harbor_cache(
+            cache_version, harbor_cache, data_type, date_range
+        )
+        if window is not None:
+            return cache_full, harbor_cache, window
+
+        _LOGGER.warning(
+            "Marées France Coordinator: Invalid or empty %s cache detected "
+            "for %s. Attempting repair.",
+            data_type,
+            self.harbor_id,
+        )
+        # Serialize repairs and prefetches so overlapping runs never write the
+        # store twice.
+        async with self._store_lock(store):
             try:
+                # Another update or a prefetch may have repaired the cache while
+                # this one was waiting for the lock.
+                cache_full, cache_version = await _async_load_versioned(store)
+                mutate = dirty_stores.get(store)
+                if mutate is not None:
+                    mutate(cache_full)
+                harbor_cache = cache_full.get(self.harbor_id, {})
+                window = self._check_harbor_cache(
+                    cache_version,
+                    harbor_cache,
+                    data_type,
+                    date_range,
+                    log_invalid=False,
+                )
+                if window is not None:
+                    _LOGGER.debug(
+                        "Marées France Coordinator: %s cache for %s was repaired "
+                        "concurrently.",
+                        data_type,
+                        self.harbor_id,
+                    )
+                    return cache_full, harbor_cache, window
+
                 if self.harbor_id in cache_full:
                     del cache_full[self.harbor_id]
-                await store.async_save(cache_full)
                 _LOGGER.info(
                     "Marées France Coordinator: Removed invalid %s cache entry for %s.",
                     data_type,
@@ -271,6 +401,8 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     websession=self.websession,
                 )
 
+                # Either save covers any pending mutation of this store.
+                dirty_stores.pop(store, None)
                 if fetch_successful:
                     _LOGGER.info(
                         "Marées France Coordinator: Successfully re-fetched %s data for %s "
@@ -287,6 +419,7 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         data_type,
                         self.harbor_id,
                     )
+                    await store.async_save(cache_full)
                     harbor_cache = {}
             except Exception:
                 _LOGGER.exception(
@@ -295,7 +428,134 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     self.harbor_id,
                 )
                 harbor_cache = {}
-        return cache_full, harbor_cache
+        window = _filter_date_range(harbor_cache, date_range)
+        return cache_full, harbor_cache, window
+
+    def _store_lock(self, store: Store[dict[str, dict[str, Any]]]) -> asyncio.Lock:
+        """Return the lock serializing read-modify-write cycles on `store`.
+
+        Cached stores are shared by all entries and carry their own lock, which
+        the prefetch jobs take as well.
+        """
+        if isinstance(store, CachedStore):
+            return store.lock
+        return self._cache_lock
+
+    def _check_harbor_cache(
+        self,
+        cache_version: int | None,
+        harbor_cache: Any,
+        data_type: str,
+        date_range: tuple[str, str] | None,
+        log_invalid: bool = True,
+    ) -> dict[str, Any] | None:
+        """Validate the harbor cache structure and collect its date window.
+
+        Args:
+            cache_version: The store's cache version the harbor cache was loaded
+                           at, None if the store does not keep one.
+            harbor_cache: The harbor-specific cache entry.
+            data_type: The data type, selecting the entry validator.
+            date_range: Optional inclusive (first, last) ISO date bounds of the
+                        entries to collect.
+            log_invalid: Whether to log why the cache is invalid.
+
+        Returns:
+            The harbor entries within `date_range` (empty without a range), or
+            None if the cache is invalid or empty and needs a repair.
+        """
+        if not isinstance(harbor_cache, dict):
+            if log_invalid:
+                _LOGGER.warning(
+                    "Marées France Coordinator: Invalid cache format for %s harbor "
+                    "'%s': Expected dict, got %s.",
+                    data_type,
+                    self.harbor_id,
+                    type(harbor_cache).__name__,
+                )
+            return None
+        if (
+            not harbor_cache and data_type != "water_levels"
+        ):  # Allow empty water_levels initially
+            if log_invalid:
+                _LOGGER.warning(
+                    "Marées France Coordinator: Empty %s cache entry found for "
+                    "harbor '%s'.",
+                    data_type,
+                    self.harbor_id,
+                )
+            return None
+
+        # Specific validation for data structures within the harbor_cache
+        is_valid_entry, expected_shape = _CACHE_ENTRY_VALIDATORS.get(
+            data_type, (_is_valid_list_entry, "list")
+        )
+        window: dict[str, Any] = {}
+        for date_key, daily_data in harbor_cache.items():
+            if not is_valid_entry(date_key, daily_data):
+                if log_invalid:
+                    _LOGGER.warning(
+                        "Marées France Coordinator: Invalid %s cache data for "
+                        "harbor '%s', date '%s': Expected %s, got %s.",
+                        data_type,
+                        self.harbor_id,
+                        date_key,
+                        expected_shape,
+                        type(daily_data).__name__,
+                    )
+                return None
+            if date_range and date_range[0] <= date_key <= date_range[1]:
+                window[date_key] = daily_data
+
+        if cache_version is not None:
+            self._validated_caches[data_type] = (
+                cache_version,
+                date_range,
+                window,
+            )
+        return window
+
+    async def _async_save_dirty_store(
+        self,
+        store: Store[dict[str, dict[str, Any]]],
+        mutate: Callable[[dict[str, dict[str, Any]]], bool],
+    ) -> None:
+        """Re-apply `mutate` to the latest data of `store` and save it if changed.
+
+        Stores are shared by all entries, so the copy loaded at the start of the
+        update cycle may be outdated by now.
+        """
+        async with self._store_lock(store):
+            cache_full = await store.async_load() or {}
+            if mutate(cache_full):
+                await store.async_save(cache_full)
+
+    async def _async_save_dirty_stores(
+        self,
+        dirty_stores: dict[
+            Store[dict[str, dict[str, Any]]],
+            Callable[[dict[str, dict[str, Any]]], bool],
+        ],
+    ) -> None:
+        """Save each store mutated during the update cycle exactly once."""
+        save_results = await asyncio.gather(
+            *(
+                self._async_save_dirty_store(store, mutate)
+                for store, mutate in dirty_stores.items()
+            ),
+            return_exceptions=True,
+        )
+        for store, result in zip(dirty_stores, save_results):
+            if not isinstance(result, BaseException):
+                continue
+            if not isinstance(result, Exception):
+                raise result  # e.g. CancelledError
+            _LOGGER.error(
+                "Marées France Coordinator: Failed to save cache store %s for %s",
+                store.key,
+                self.harbor_id,
+                exc_info=result,
+            )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch and process tide, coefficient, and water level data.
@@ -315,19 +575,47 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "Marées France Coordinator: Starting update cycle for %s", self.harbor_id
         )
 
-        try:
-            tides_cache_full = await self.tides_store.async_load() or {}
-            coeff_cache_full = await self.coeff_store.async_load() or {}
-            water_level_cache_full = await self.water_level_store.async_load() or {}
-            watertemp_cache_full = await self.watertemp_store.async_load() or {}
-        except Exception as e:
-            _LOGGER.exception(
-                "Marées France Coordinator: Failed to load cache stores for %s",
+        stores = (
+            self.tides_store,
+            self.coeff_store,
+            self.water_level_store,
+            self.watertemp_store,
+        )
+        load_results = await asyncio.gather(
+            *(_async_load_versioned(store) for store in stores),
+            return_exceptions=True,
+        )
+        load_error: Exception | None = None
+        for store, result in zip(stores, load_results):
+            if not isinstance(result, BaseException):
+                continue
+            if not isinstance(result, Exception):
+                raise result  # e.g. CancelledError
+            _LOGGER.error(
+                "Marées France Coordinator: Failed to load cache store %s for %s",
+                store.key,
                 self.harbor_id,
+                exc_info=result,
             )
-            raise UpdateFailed(f"Failed to load cache: {e}") from e
-
-        await self.prune_watertemp_cache()
+            load_error = result
+        if load_error is not None:
+            raise UpdateFailed(f"Failed to load cache: {load_error}") from load_error
+        (
+            (tides_cache_full, tides_cache_version),
+            (coeff_cache_full, coeff_cache_version),
+            (water_level_cache_full, water_level_cache_version),
+            (watertemp_cache_full, watertemp_cache_version),
+        ) = load_results
+
+        # Stores mutated during this update and the mutation to re-apply to their
+        # latest data when saving them once at the end of the cache stage. Kept
+        # per call so overlapping updates never drop each other's marks.
+        dirty_stores: dict[
+            Store[dict[str, dict[str, Any]]],
+            Callable[[dict[str, dict[str, Any]]], bool],
+        ] = {}
+        if self.prune_watertemp_cache(watertemp_cache_full):
+            dirty_stores[self.watertemp_store] = self.prune_watertemp_cache
 
         if not all(
             k in self.config_entry.data for k in [CONF_HARBOR_LAT, CONF_HARBOR_LON]
@@ -372,41 +660,61 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 )
 
         today = date.today()
-        today_str = today.strftime(DATE_FORMAT)
-        yesterday_str = (today - timedelta(days=1)).strftime(DATE_FORMAT)
+        today_str = today.isoformat()
+        yesterday_str = (today - timedelta(days=1)).isoformat()
         tide_fetch_duration = 8
+        future_window_days = 366
+        # Date keys are ISO formatted, so a string range check is a date range check.
+        window_end_str = (today + timedelta(days=future_window_days)).isoformat()
 
-        tides_cache_full, harbor_tides_cache = await self._validate_and_repair_cache(
+        (
+            tides_cache_full,
+            _,
+            tides_data_for_parser,  # Yesterday for tides
+        ) = await self._validate_and_repair_cache(
             self.tides_store,
             tides_cache_full,
+            tides_cache_version,
             "tides",
             _async_fetch_and_store_tides,
             (yesterday_str, tide_fetch_duration),
+            dirty_stores,
+            (yesterday_str, window_end_str),
         )
 
         first_day_of_current_month = today.replace(day=1)
         coeff_fetch_days = 365
-        coeff_cache_full, harbor_coeff_cache = await self._validate_and_repair_cache(
+        (
+            coeff_cache_full,
+            _,
+            coeff_data_for_parser,  # Today for coeffs
+        ) = await self._validate_and_repair_cache(
             self.coeff_store,
             coeff_cache_full,
+            coeff_cache_version,
             "coefficients",
             _async_fetch_and_store_coefficients,
             (first_day_of_current_month, coeff_fetch_days),
+            dirty_stores,
+            (today_str, window_end_str),
         )
 
         # Validate water levels, but repair fetch only targets today if triggered by validation.
         # Full prefetch is handled by scheduled jobs in __init__.py.
-        _, harbor_water_level_cache_validated = await self._validate_and_repair_cache(
+        # The returned caches already reflect any repair, no need to reload the store.
+        (
+            water_level_cache_full,
+            harbor_water_level_cache,
+            _,
+        ) = await self._validate_and_repair_cache(
             self.water_level_store,
             water_level_cache_full,
+            water_level_cache_version,
             "water_levels",
             _async_fetch_and_store_water_level,
             (today_str,),
+            dirty_stores,
         )
-        # Reload full water level cache as repair might have modified it.
-        water_level_cache_full = await self.water_level_store.async_load() or {}
-        # Use the potentially repaired harbor-specific cache for today's data.
-        harbor_water_level_cache = water_level_cache_full.get(self.harbor_id, {})
 
         lat = self.config_entry.data.get(CONF_HARBOR_LAT)
         lon = self.config_entry.data.get(CONF_HARBOR_LON)
@@ -414,17 +722,17 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             (
                 watertemp_cache_full,
                 _,
+                _,
             ) = await self._validate_and_repair_cache(
                 self.watertemp_store,
                 watertemp_cache_full,
+                watertemp_cache_version,
                 "watertemp",
                 _async_fetch_and_store_water_temp,
                 (lat, lon),
+                dirty_stores,
             )
 
-        future_window_days = 366
-        tides_data_for_parser = {}
-        coeff_data_for_parser = {}
         water_level_data_for_parser = harbor_water_level_cache.get(today_str)
         harbor_watertemp_cache = watertemp_cache_full.get(self.harbor_id, {})
 
@@ -435,42 +743,48 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 today_str,
                 self.harbor_id,
             )
-            fetched_data = await _async_fetch_and_store_water_level(
-                self.hass,
-                self.water_level_store,
-                water_level_cache_full,
-                self.harbor_id,
-                today_str,
-                websession=self.websession,
-            )
-            if fetched_data:
-                _LOGGER.info(
-                    "Marées France Coordinator: Successfully fetched today's water "
-                    "level data on demand."
+            async with self._store_lock(self.water_level_store):
+                # A prefetch or another update may have fetched it while this one
+                # was waiting for the lock.
+                latest_cache_full = await self.water_level_store.async_load() or {}
+                latest_harbor_cache = latest_cache_full.get(self.harbor_id)
+                latest_entry = (
+                    latest_harbor_cache.get(today_str)
+                    if isinstance(latest_harbor_cache, dict)
+                    else None
                 )
-                water_level_data_for_parser = fetched_data
-                harbor_water_level_cache[today_str] = fetched_data  # Update local view
-            else:
-                _LOGGER.warning(
-                    "Marées France Coordinator: Failed to fetch today's water level data "
-                    "on demand. Current height will be unavailable.",
+                water_level_cache_full = latest_cache_full
+                if _is_valid_water_levels_entry(today_str, latest_entry):
+                    water_level_data_for_parser = latest_entry
+                    _LOGGER.debug(
+                        "Marées France Coordinator: Today's water level data was "
+                        "fetched concurrently."
+                    )
+                else:
+                    fetched_data = await _async_fetch_and_store_water_level(
+                        self.hass,
+                        self.water_level_store,
+                        latest_cache_full,
+                        self.harbor_id,
+                        today_str,
+                        websession=self.websession,
+                    )
+                    if fetched_data:
+                        _LOGGER.info(
+                            "Marées France Coordinator: Successfully fetched today's "
+                            "water level data on demand."
+                        )
+                        water_level_data_for_parser = fetched_data
+                    else:
+                        _LOGGER.warning(
+                            "Marées France Coordinator: Failed to fetch today's water "
+                            "level data on demand. Current height will be unavailable.",
+                        )
+                harbor_water_level_cache = water_level_cache_full.get(
+                    self.harbor_id, {}
                 )
 
-        for i in range(-1, future_window_days + 1):  # Yesterday for tides
-            check_date = today + timedelta(days=i)
-            check_date_str = check_date.strftime(DATE_FORMAT)
-            if check_date_str in harbor_tides_cache:
-                tides_data_for_parser[check_date_str] = harbor_tides_cache[
-                    check_date_str
-                ]
-
-        for i in range(future_window_days + 1):  # Today for coeffs
-            check_date = today + timedelta(days=i)
-            check_date_str = check_date.strftime(DATE_FORMAT)
-            if check_date_str in harbor_coeff_cache:
-                coeff_data_for_parser[check_date_str] = harbor_coeff_cache[
-                    check_date_str
-                ]
+        await self._async_save_dirty_stores(dirty_stores)
 
         _LOGGER.debug(
             "Marées France Coordinator: Loaded %d days of tide data and %d days of "
@@ -498,18 +812,6 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
 
         try:
-            translations = await async_get_translations(
-                self.hass, self.hass.config.language, "entity", {DOMAIN}
-            )
-            translation_high = translations.get(
-                f"component.{DOMAIN}.entity.sensor.tides.state.{STATE_HIGH_TIDE}",
-                STATE_HIGH_TIDE.replace("_", " ").title(),
-            )
-            translation_low = translations.get(
-                f"component.{DOMAIN}.entity.sensor.tides.state.{STATE_LOW_TIDE}",
-                STATE_LOW_TIDE.replace("_", " ").title(),
-            )
-
             _LOGGER.debug(
                 "Marées France Coordinator: Calling _parse_tide_data with "
                 "water_level_data_for_parser: %s",
@@ -520,8 +822,6 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 coeff_data_for_parser,
                 water_level_data_for_parser,
                 harbor_watertemp_cache,
-                translation_high,  # Though unused, kept for signature consistency
-                translation_low,  # Though unused, kept for signature consistency
             )
         except Exception as err:
             _LOGGER.exception(
@@ -530,52 +830,73 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             raise UpdateFailed(f"Error processing data: {err}") from err
 
-    async def _parse_tide_data(
+    def _coefficient_calendar(
+        self, coeff_raw_data: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, int], list[str], list[int]]:
+        """Return the daily maximum coefficients of the window, computed once.
+
+        Args:
+            coeff_raw_data: Raw coefficient data, mapping dates to lists of coeffs.
+
+        Returns:
+            A tuple containing:
+                - The coefficient window the calendar was built from.
+                - The highest coefficient of each date that has one.
+                - Those dates, sorted.
+                - Their highest coefficients, in the same order.
+        """
+        if (
+            self._coeff_calendar is None
+            or self._coeff_calendar[0] is not coeff_raw_data
+        ):
+            daily_max = _daily_max_coefficients(coeff_raw_data)
+            calendar_dates = sorted(daily_max)
+            self._coeff_calendar = (
+                coeff_raw_data,
+                daily_max,
+                calendar_dates,
+                [daily_max[day_str] for day_str in calendar_dates],
+            )
+        return self._coeff_calendar
+
+    def _build_tide_timeline(
         self,
         tides_raw_data: dict[str, list[list[str]]],
         coeff_raw_data: dict[str, list[str]],
-        water_level_raw_data: dict[str, list[list[str]]] | None,
-        water_temp_raw_data: dict[str, list[dict[str, Any]]] | None,
-        _translation_high: str,  # Parameter kept for signature, but not used directly
-        _translation_low: str,  # Parameter kept for signature, but not used directly
-    ) -> dict[str, Any]:
-        """Parse raw tide, coefficient, and water level data into a structured format.
-        This method takes the raw data fetched from the SHOM API (via cache)
-        and transforms it into a dictionary containing:
-        - Information about the current tide (if any).
-        - Information about the next tide event.
-        - Information about the previous tide event.
-        - The date and coefficient of the next spring tide.
-        - The date and coefficient of the next neap tide.
-        - The current water height (if available).
-        - A timestamp of the last update.
+        paris_tz: ZoneInfo,
+    ) -> tuple[list[dict[str, Any]], list[int]]:
+        """Flatten raw tide data into a chronological list of tide events.
+
+        Tides published without a coefficient get the highest coefficient
+        of their day.
+
         Args:
             tides_raw_data: Raw tide data, mapping dates to lists of tide events.
-                            Expected to cover yesterday through future dates.
             coeff_raw_data: Raw coefficient data, mapping dates to lists of coeffs.
-                            Expected to cover today through future dates.
-            water_level_raw_data: Raw water level data for today, structured as
-                                  `{date_str: [[timestamp_str, height_str], ...]}`.
-                                  Can be None if not available.
-            water_temp_raw_data: Raw water temperature data. Can be None.
-            _translation_high: Translation for "High Tide" (unused).
-            _translation_low: Translation for "Low Tide" (unused).
+            paris_tz: The Europe/Paris timezone the SHOM times are expressed in.
+
         Returns:
-            A dictionary containing parsed and processed tide information.
+            A tuple containing:
+                - The tide events sorted by time.
+                - The Unix timestamp of each event, in the same order (bisect keys).
         """
-        now_utc = datetime.now(timezone.utc)
-        last_update_iso = now_utc.isoformat()
-
-        if not tides_raw_data:
-            _LOGGER.warning(
-                "Marées France Coordinator: No tide data provided to _parse_tide_data."
-            )
-            return {"last_update": last_update_iso}
-
         all_tides_flat: list[dict[str, Any]] = []
-        paris_tz = await self.hass.async_add_executor_job(pytz.timezone, "Europe/Paris")
 
-        for day_str, tides in tides_raw_data.items():
+        # ISO date keys sort chronologically and SHOM lists each day's tides in
+        # time order, so walking the days in key order yields a sorted timeline.
+        for day_str in sorted(tides_raw_data):
+            tides = tides_raw_data[day_str]
+            # Dates are always YYYY-MM-DD: slice once per day instead of strptime per tide.
+            try:
+                if len(day_str) != 10:
+                    raise ValueError(day_str)
+                year, month, day = (
+                    int(day_str[0:4]),
+                    int(day_str[5:7]),
+                    int(day_str[8:10]),
+                )
+            except ValueError:
+                year = None
             for tide_info in tides:
                 if not isinstance(tide_info, (list, tuple)) or len(tide_info) != 4:
                     _LOGGER.warning(
@@ -589,11 +910,16 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 if time_str == "--:--" or height_str == "---":
                     continue
                 try:
-                    tide_dt_naive = datetime.strptime(
-                        f"{day_str} {time_str}", f"{DATE_FORMAT} %H:%M"
-                    )
-                    tide_dt_local = paris_tz.localize(tide_dt_naive)
-                    tide_dt_utc = tide_dt_local.astimezone(timezone.utc)
+                    if year is None or len(time_str) != 5 or time_str[2] != ":":
+                        raise ValueError(time_str)
+                    tide_dt_utc = datetime(
+                        year,
+                        month,
+                        day,
+                        int(time_str[0:2]),
+                        int(time_str[3:5]),
+                        tzinfo=paris_tz,
+                    ).astimezone(timezone.utc)
                 except ValueError:
                     _LOGGER.warning(
                         "Marées France Coordinator: Could not parse datetime: %s %s",
@@ -608,59 +934,132 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     "time_local": time_str,
                     "height": height_str,
                     "coefficient": coeff_value,
-                    "datetime_utc": tide_dt_utc.isoformat(),
+                    "datetime_utc": tide_dt_utc,  # Serialized only for the output
                     "date_local": day_str,
-                    "translated_type": (  # Convert dots to underscores for frontend
-                        "tide_high"
-                        if tide_type == TIDE_HIGH
-                        else "tide_low"
-                        if tide_type == TIDE_LOW
-                        else "Unknown"
-                    ),
+                    "translated_type": _TRANSLATED_TYPE.get(tide_type, "Unknown"),
                 }
                 all_tides_flat.append(flat_entry)
 
-        all_tides_flat.sort(key=lambda x: x["datetime_utc"])
-
+        # Highest coefficient of each day, used for tides published without one.
+        daily_max_coeff = self._coefficient_calendar(coeff_raw_data)[1]
+        # Checked once: the loop below covers a year of tides.
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
         for tide in all_tides_flat:
             if tide["coefficient"] is None:
-                day_coeffs = coeff_raw_data.get(tide["date_local"])
-                if day_coeffs and isinstance(day_coeffs, list):
-                    try:
-                        valid_coeffs_int = [
-                            int(c)
-                            for c in day_coeffs
-                            if isinstance(c, str) and c.isdigit()
-                        ]
-                        if valid_coeffs_int:
-                            tide["coefficient"] = str(max(valid_coeffs_int))
-                            _LOGGER.debug(
-                                "Marées France Coordinator: Assigned max daily coeff %s to "
-                                "tide on %s %s",
-                                tide["coefficient"],
-                                tide["date_local"],
-                                tide["time_local"],
-                            )
-                        else:
-                            tide["coefficient"] = None
-                    except (ValueError, TypeError):
-                        _LOGGER.warning(
-                            "Marées France Coordinator: Error processing daily coefficients "
-                            "for %s %s: %s",
+                max_coeff = daily_max_coeff.get(tide["date_local"])
+                if max_coeff is not None:
+                    tide["coefficient"] = str(max_coeff)
+                    if debug_enabled:
+                        _LOGGER.debug(
+                            "Marées France Coordinator: Assigned max daily coeff %s "
+                            "to tide on %s %s",
+                            tide["coefficient"],
                             tide["date_local"],
                             tide["time_local"],
-                            day_coeffs,
                         )
-                        tide["coefficient"] = None
-                else:
-                    tide["coefficient"] = None
 
-        now_tide_index = -1
-        for i, tide in enumerate(all_tides_flat):
-            tide_dt = datetime.fromisoformat(tide["datetime_utc"])
-            if tide_dt > now_utc:
-                now_tide_index = i
-                break
+        # Integer keys compare much faster than aware datetimes in the bisect.
+        return all_tides_flat, [
+            int(tide["datetime_utc"].timestamp()) for tide in all_tides_flat
+        ]
+
+    def _water_level_samples(
+        self, day_str: str, water_levels: list[list[str]]
+    ) -> tuple[array[int], list[str]]:
+        """Return the day's water level samples as seconds since midnight.
+
+        The parsed samples are cached until the day or the source list changes.
+
+        Args:
+            day_str: The date of the samples (YYYY-MM-DD).
+            water_levels: The `[[time_str, height_str], ...]` samples of the day.
+
+        Returns:
+            A tuple of the sorted sample times in seconds since midnight and the
+            matching height strings.
+        """
+        cached = self._water_levels_cache
+        if cached is not None and cached[0] == day_str and cached[1] is water_levels:
+            return cached[2], cached[3]
+
+        samples: list[tuple[int, str]] = []
+        for entry in water_levels:
+            try:
+                time_str, height_str = entry[0], entry[1]
+                hours, minutes, *seconds = time_str.split(":")
+                entry_secs = int(hours) * 3600 + int(minutes) * 60
+                if seconds:
+                    entry_secs += int(seconds[0])
+            except (ValueError, TypeError, IndexError, AttributeError):
+                continue
+            samples.append((entry_secs, height_str))
+        samples.sort(key=lambda sample: sample[0])
+
+        sample_secs = array("i", [sample[0] for sample in samples])
+        sample_heights = [sample[1] for sample in samples]
+        self._water_levels_cache = (day_str, water_levels, sample_secs, sample_heights)
+        return sample_secs, sample_heights
+
+    async def _parse_tide_data(
+        self,
+        tides_raw_data: dict[str, list[list[str]]],
+        coeff_raw_data: dict[str, list[str]],
+        water_level_raw_data: dict[str, list[list[str]]] | None,
+        water_temp_raw_data: dict[str, list[dict[str, Any]]] | None,
+    ) -> dict[str, Any]:
+        """Parse raw tide, coefficient, and water level data into a structured format.
+        This method takes the raw data fetched from the SHOM API (via cache)
+        and transforms it into a dictionary containing:
+        - Information about the current tide (if any).
+        - Information about the next tide event.
+        - Information about the previous tide event.
+        - The date and coefficient of the next spring tide.
+        - The date and coefficient of the next neap tide.
+        - The current water height (if available).
+        - A timestamp of the last update.
+        Args:
+            tides_raw_data: Raw tide data, mapping dates to lists of tide events.
+                            Expected to cover yesterday through future dates.
+            coeff_raw_data: Raw coefficient data, mapping dates to lists of coeffs.
+                            Expected to cover today through future dates.
+            water_level_raw_data: Raw water level data for today, structured as
+                                  `{date_str: [[timestamp_str, height_str], ...]}`.
+                                  Can be None if not available.
+            water_temp_raw_data: Raw water temperature data. Can be None.
+        Returns:
+            A dictionary containing parsed and processed tide information.
+        """
+        now_utc = datetime.now(timezone.utc)
+        last_update_iso = now_utc.isoformat()
+
+        if not tides_raw_data:
+            _LOGGER.warning(
+                "Marées France Coordinator: No tide data provided to _parse_tide_data."
+            )
+            return {"last_update": last_update_iso}
+
+        paris_tz = await self.hass.async_add_executor_job(ZoneInfo, "Europe/Paris")
+
+        # Tide events and coefficients change at most daily: only rebuild the
+        # timeline when the raw data differs from the previous update.
+        timeline_source = (tides_raw_data, coeff_raw_data)
+        if self._tide_timeline is None or self._tide_timeline_source != timeline_source:
+            self._tide_timeline = self._build_tide_timeline(
+                tides_raw_data, coeff_raw_data, paris_tz
+            )
+            self._tide_timeline_source = timeline_source
+        else:
+            _LOGGER.debug(
+                "Marées France Coordinator: Tide data unchanged for %s, reusing "
+                "parsed timeline.",
+                self.harbor_id,
+            )
+        all_tides_flat, tide_keys = self._tide_timeline
+
+        # Index of the first tide strictly after now (-1 if all tides are past).
+        now_tide_index = bisect.bisect_right(tide_keys, int(now_utc.timestamp()))
+        if now_tide_index == len(all_tides_flat):
+            now_tide_index = -1
 
         now_data = None
         next_data = None
@@ -668,6 +1067,7 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         if now_tide_index != -1:
             next_tide_event = all_tides_flat[now_tide_index]
+            next_time_iso = next_tide_event["datetime_utc"].isoformat()
             next_starting_height = (
                 all_tides_flat[now_tide_index - 1]["height"]
                 if now_tide_index > 0
@@ -675,8 +1075,9 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             next_data = {
                 ATTR_TIDE_TREND: next_tide_event["translated_type"],
-                ATTR_STARTING_TIME: next_tide_event["datetime_utc"],
-                ATTR_FINISHED_TIME: next_tide_event["datetime_utc"],
+                ATTR_STARTING_TIME: next_time_iso,
+                ATTR_FINISHED_TIME: next_time_iso,
+                ATTR_FINISHED_TIME_DT: next_tide_event["datetime_utc"],
                 ATTR_STARTING_HEIGHT: next_starting_height,
                 ATTR_FINISHED_HEIGHT: next_tide_event["height"],
                 ATTR_COEFFICIENT: next_tide_event["coefficient"],
@@ -684,6 +1085,7 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             if now_tide_index > 0:
                 previous_tide_event = all_tides_flat[now_tide_index - 1]
+                previous_time_iso = previous_tide_event["datetime_utc"].isoformat()
                 previous_starting_height = (
                     all_tides_flat[now_tide_index - 2]["height"]
                     if now_tide_index > 1
@@ -691,8 +1093,9 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 )
                 previous_data = {
                     ATTR_TIDE_TREND: previous_tide_event["translated_type"],
-                    ATTR_STARTING_TIME: previous_tide_event["datetime_utc"],
-                    ATTR_FINISHED_TIME: previous_tide_event["datetime_utc"],
+                    ATTR_STARTING_TIME: previous_time_iso,
+                    ATTR_FINISHED_TIME: previous_time_iso,
+                    ATTR_FINISHED_TIME_DT: previous_tide_event["datetime_utc"],
                     ATTR_STARTING_HEIGHT: previous_starting_height,
                     ATTR_FINISHED_HEIGHT: previous_tide_event["height"],
                     ATTR_COEFFICIENT: previous_tide_event["coefficient"],
@@ -703,8 +1106,8 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 )
                 now_data = {
                     ATTR_TIDE_TREND: tide_status,
-                    ATTR_STARTING_TIME: previous_tide_event["datetime_utc"],
-                    ATTR_FINISHED_TIME: next_tide_event["datetime_utc"],
+                    ATTR_STARTING_TIME: previous_time_iso,
+                    ATTR_FINISHED_TIME: next_time_iso,
                     ATTR_STARTING_HEIGHT: previous_tide_event["height"],
                     ATTR_FINISHED_HEIGHT: next_tide_event["height"],
                     ATTR_COEFFICIENT: next_tide_event["coefficient"],
@@ -713,7 +1116,9 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Keep water height calculation, but simplify water temp handling.
         current_water_height = None
         water_levels: list[list[str]] | None = None
-        today_str_key = date.today().strftime(DATE_FORMAT)
+        # Local date, shared by the water level lookup and the coefficient scan.
+        today = date.today()
+        today_str_key = today.isoformat()
 
         if isinstance(water_level_raw_data, dict) and isinstance(
             water_level_raw_data.get(today_str_key), list
@@ -721,32 +1126,31 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             water_levels = cast(list[list[str]], water_level_raw_data[today_str_key])
 
         if water_levels:
-            closest_entry = None
-            min_diff = timedelta.max
-            for entry in water_levels:
-                try:
-                    if len(entry) < 2:
-                        continue
-                    time_str, height_str = entry, entry
-                    if len(time_str) == 5:
-                        time_str += ":00"
-                    dt_naive = datetime.strptime(
-                        f"{today_str_key} {time_str}", f"{DATE_FORMAT} %H:%M:%S"
-                    )
-                    dt_local = paris_tz.localize(dt_naive)
-                    entry_dt = dt_local.astimezone(timezone.utc)
-                    diff = abs(now_utc - entry_dt)
-                    if diff < min_diff:
-                        min_diff = diff
-                        closest_entry = height_str
-                except (ValueError, TypeError, pytz.exceptions.Error):
-                    continue
-
-            if closest_entry and min_diff <= timedelta(minutes=15):
-                try:
-                    current_water_height = float(closest_entry)
-                except (ValueError, TypeError):
-                    pass  # Keep it None if conversion fails
+            # Samples are Paris wall-clock times of today: compare them with the
+            # current Paris time of day instead of localizing every sample.
+            now_local = now_utc.astimezone(paris_tz)
+            now_secs = (
+                (now_local.date() - today).days * 86400
+                + now_local.hour * 3600
+                + now_local.minute * 60
+                + now_local.second
+            )
+            sample_secs, sample_heights = self._water_level_samples(
+                today_str_key, water_levels
+            )
+            if sample_secs:
+                # Nearest sample: the first one at or after now, or the one before.
+                idx = bisect.bisect_left(sample_secs, now_secs)
+                if idx == len(sample_secs) or (
+                    idx > 0
+                    and now_secs - sample_secs[idx - 1] <= sample_secs[idx] - now_secs
+                ):
+                    idx -= 1
+                if abs(now_secs - sample_secs[idx]) <= 15 * 60:
+                    try:
+                        current_water_height = float(sample_heights[idx])
+                    except (ValueError, TypeError):
+                        pass  # Keep it None if conversion fails
 
         if now_data:
             now_data[ATTR_CURRENT_HEIGHT] = current_water_height
@@ -754,78 +1158,74 @@ class MareesFranceUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if ATTR_WATER_TEMP in now_data:
                 del now_data[ATTR_WATER_TEMP]
 
+        _, _, calendar_dates, calendar_max_coeffs = self._coefficient_calendar(
+            coeff_raw_data
+        )
+        first_index = bisect.bisect_left(calendar_dates, today_str_key)
+
+        # The search result only changes with the calendar or the day.
+        special_tides = self._special_tide_indexes
+        if (
+            special_tides is None
+            or special_tides[0] is not calendar_max_coeffs
+            or special_tides[1] != first_index
+        ):
+            special_tides = (
+                calendar_max_coeffs,
+                first_index,
+                *_find_special_tides(
+                    calendar_max_coeffs,
+                    first_index,
+                    SPRING_TIDE_THRESHOLD,
+                    NEAP_TIDE_THRESHOLD,
+                ),
+            )
+            self._special_tide_indexes = special_tides
+        _, _, spring_index, neap_index = special_tides
+
         next_spring_date_str = None
         next_spring_coeff = None
         next_neap_date_str = None
         next_neap_coeff = None
-        found_spring = False
-        found_neap = False
-        today_str_compare = now_utc.strftime(DATE_FORMAT)
-        sorted_coeff_dates = sorted(coeff_raw_data.keys())
-
-        for day_str in sorted_coeff_dates:
-            if day_str < today_str_compare:
-                continue
-            daily_coeffs = coeff_raw_data.get(day_str)
-            if daily_coeffs and isinstance(daily_coeffs, list):
-                try:
-                    valid_coeffs_int = [
-                        int(c)
-                        for c in daily_coeffs
-                        if isinstance(c, str) and c.isdigit()
-                    ]
-                    if not valid_coeffs_int:
-                        continue
-                    max_coeff = max(valid_coeffs_int)
-
-                    if not found_spring and max_coeff >= SPRING_TIDE_THRESHOLD:
-                        next_spring_date_str = day_str
-                        next_spring_coeff = str(max_coeff)
-                        found_spring = True
-                        _LOGGER.debug(
-                            "Marées France Coordinator: Found next Spring Tide date: %s "
-                            "(Coeff: %s)",
-                            next_spring_date_str,
-                            next_spring_coeff,
-                        )
-                    if not found_neap and max_coeff <= NEAP_TIDE_THRESHOLD:
-                        next_neap_date_str = day_str
-                        next_neap_coeff = str(max_coeff)
-                        found_neap = True
-                        _LOGGER.debug(
-                            "Marées France Coordinator: Found next Neap Tide date: %s "
-                            "(Coeff: %s)",
-                            next_neap_date_str,
-                            next_neap_coeff,
-                        )
-                except (ValueError, TypeError):
-                    _LOGGER.warning(
-                        "Marées France Coordinator: Error processing coefficients for %s: %s",
-                        day_str,
-                        daily_coeffs,
-                    )
-            if found_spring and found_neap:
-                break
-
-        next_spring_date_obj = (
-            date.fromisoformat(next_spring_date_str) if next_spring_date_str else None
-        )
-        next_neap_date_obj = (
-            date.fromisoformat(next_neap_date_str) if next_neap_date_str else None
-        )
+        if spring_index != -1:
+            next_spring_date_str = calendar_dates[spring_index]
+            next_spring_coeff = str(calendar_max_coeffs[spring_index])
+            _LOGGER.debug(
+                "Marées France Coordinator: Found next Spring Tide date: %s "
+                "(Coeff: %s)",
+                next_spring_date_str,
+                next_spring_coeff,
+            )
+        if neap_index != -1:
+            next_neap_date_str = calendar_dates[neap_index]
+            next_neap_coeff = str(calendar_max_coeffs[neap_index])
+            _LOGGER.debug(
+                "Marées France Coordinator: Found next Neap Tide date: %s "
+                "(Coeff: %s)",
+                next_neap_date_str,
+                next_neap_coeff,
+            )
 
-        final_data = {
-            "now_data": now_data,
-            "next_data": next_data,
-            "previous_data": previous_data,
-            "next_spring_date": next_spring_date_obj,
-            "next_spring_coeff": next_spring_coeff,
-            "next_neap_date": next_neap_date_obj,
-            "next_neap_coeff": next_neap_coeff,
-            "last_update": last_update_iso,
-            # Pass the raw water temp data directly to the sensors
-            "water_temp_data": water_temp_raw_data.get(today_str_key)
-            if water_temp_raw_data
-            else None,
-        }
-        return {k: v for k, v in final_data.items() if v is not None}
+        # Only keys with a value are published.
+        final_data: dict[str, Any] = {}
+        if now_data is not None:
+            final_data["now_data"] = now_data
+        if next_data is not None:
+            final_data["next_data"] = next_data
+        if previous_data is not None:
+            final_data["previous_data"] = previous_data
+        if next_spring_date_str:
+            final_data["next_spring_date"] = _parse_iso_date(next_spring_date_str)
+        if next_spring_coeff is not None:
+            final_data["next_spring_coeff"] = next_spring_coeff
+        if next_neap_date_str:
+            final_data["next_neap_date"] = _parse_iso_date(next_neap_date_str)
+        if next_neap_coeff is not None:
+            final_data["next_neap_coeff"] = next_neap_coeff
+        final_data["last_update"] = last_update_iso
+        # Pass the raw water temp data directly to the sensors
+        if water_temp_raw_data:
+            water_temp_data = water_temp_raw_data.get(today_str_key)
+            if water_temp_data is not None:
+                final_data["water_temp_data"] = water_temp_data
+        return final_data
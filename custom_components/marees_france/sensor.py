@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import bisect
 import logging
-from datetime import datetime
-from typing import Any, cast
+import re
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -22,6 +25,7 @@ from .const import (
     ATTR_CURRENT_HEIGHT,
     ATTR_FINISHED_HEIGHT,
     ATTR_FINISHED_TIME,
+    ATTR_FINISHED_TIME_DT,
     ATTR_STARTING_HEIGHT,
     ATTR_STARTING_TIME,
     ATTR_TIDE_TREND,
@@ -35,6 +39,45 @@ from .coordinator import MareesFranceUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Usual shape of the forecast timestamps, parsed without the generic ISO parser.
+_FORECAST_TIME_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(Z|[+-]\d{2}:\d{2})$"
+)
+
+
+def _parse_forecast_time(value: str) -> datetime | None:
+    """Parse a water temperature forecast timestamp.
+
+    Args:
+        value: The ISO 8601 timestamp of the forecast.
+
+    Returns:
+        The parsed datetime, or None if it cannot be parsed.
+
+    Raises:
+        ValueError: If a field of the timestamp is out of range.
+    """
+    match = _FORECAST_TIME_RE.match(value)
+    if match is None:
+        return dt_util.parse_datetime(value)
+    offset = match[7]
+    if offset in ("Z", "+00:00"):
+        tzinfo = timezone.utc
+    else:
+        offset_minutes = int(offset[1:3]) * 60 + int(offset[4:6])
+        if offset[0] == "-":
+            offset_minutes = -offset_minutes
+        tzinfo = timezone(timedelta(minutes=offset_minutes))
+    return datetime(
+        int(match[1]),
+        int(match[2]),
+        int(match[3]),
+        int(match[4]),
+        int(match[5]),
+        int(match[6]),
+        tzinfo=tzinfo,
+    )
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -99,6 +142,15 @@ class MareesFranceBaseSensor(
         self._sensor_key_suffix = (
             sensor_key_suffix  # Used for unique ID and data access
         )
+        # For "now", "next", "previous" sensors, data is under "now_data", "next_data", etc.
+        # For "next_spring_date", "next_neap_date", data is directly under those keys.
+        self._data_key = (
+            f"{sensor_key_suffix}_data"
+            if sensor_key_suffix in ("now", "next", "previous")
+            else sensor_key_suffix
+        )
+        # (coordinator data, attributes) of the last attributes build.
+        self._attrs_cache: tuple[Any, dict[str, Any] | None] | None = None
 
         self._attr_unique_id = (
             f"{DOMAIN}_{self._harbor_id.lower()}_{self._sensor_key_suffix}"
@@ -123,18 +175,25 @@ class MareesFranceBaseSensor(
         """
         return (
             super().available  # Checks coordinator.last_update_success and coordinator.data
-            and self.coordinator.data is not None
+            and (data := self.coordinator.data) is not None
             # Check for the specific data key related to this sensor type
-            # For "now", "next", "previous" sensors, data is under "now_data", "next_data", etc.
-            # For "next_spring_date", "next_neap_date", data is directly under those keys.
-            and (
-                f"{self._sensor_key_suffix}_data" in self.coordinator.data
-                if self._sensor_key_suffix in ["now", "next", "previous"]
-                else self._sensor_key_suffix
-                in self.coordinator.data  # For date sensors
-            )
+            and self._data_key in data
         )
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the sensor attributes, rebuilt only when the coordinator data changes."""
+        data = self.coordinator.data
+        cached = self._attrs_cache
+        if cached is None or cached[0] is not data:
+            cached = (data, self._build_extra_state_attributes())
+            self._attrs_cache = cached
+        return cached[1]
+
+    def _build_extra_state_attributes(self) -> dict[str, Any] | None:
+        """Build the sensor attributes from the coordinator data."""
+        return None
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator.
@@ -179,7 +238,7 @@ class MareesFranceNowSensor(MareesFranceBaseSensor):
         """Helper to get the 'now_data' block from the coordinator."""
         if not self.coordinator.data:
             return None
-        return cast(dict[str, Any] | None, self.coordinator.data.get("now_data"))
+        return self.coordinator.data.get("now_data")
 
     @property
     def native_value(self) -> str | None:
@@ -188,8 +247,7 @@ class MareesFranceNowSensor(MareesFranceBaseSensor):
             return self._sensor_data.get(ATTR_TIDE_TREND)
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_extra_state_attributes(self) -> dict[str, Any] | None:
         """Return attributes like current height, coefficient, start/end times and heights."""
         if self.available and self._sensor_data:
             attrs: dict[str, Any] = {}
@@ -244,36 +302,26 @@ class MareesFranceTimestampSensor(MareesFranceBaseSensor):
     def _sensor_data(self) -> dict[str, Any] | None:
         """Helper to get the specific data block (e.g., 'next_data') from coordinator."""
         if self.coordinator.data:
-            return cast(
-                dict[str, Any] | None,
-                self.coordinator.data.get(f"{self._sensor_key_suffix}_data"),
-            )
+            return self.coordinator.data.get(self._data_key)
         return None
 
     @property
     def native_value(self) -> datetime | None:
         """Return the timestamp of the tide event (UTC datetime object)."""
         if self.available and self._sensor_data:
-            # The state is the time of the event itself (ATTR_FINISHED_TIME from coordinator)
-            event_time_str = self._sensor_data.get(ATTR_FINISHED_TIME)
-            if event_time_str:
-                try:
-                    return dt_util.parse_datetime(event_time_str)
-                except ValueError:
-                    _LOGGER.warning(
-                        "Could not parse event time for '%s' sensor: %s",
-                        self._sensor_key_suffix,
-                        event_time_str,
-                    )
+            # The state is the time of the event itself, parsed by the coordinator
+            return self._sensor_data.get(ATTR_FINISHED_TIME_DT)
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_extra_state_attributes(self) -> dict[str, Any] | None:
         """Return attributes like tide type, height, coefficient."""
         if self.available and self._sensor_data:
-            return cast(
-                dict[str, Any], self._sensor_data
-            )  # The whole block is relevant
+            # The whole block is relevant, except the parsed time used for the state
+            return {
+                key: value
+                for key, value in self._sensor_data.items()
+                if key != ATTR_FINISHED_TIME_DT
+            }
         return None
 
 
@@ -348,8 +396,7 @@ class MareesFranceNextSpecialTideSensor(MareesFranceBaseSensor):
             return None
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_extra_state_attributes(self) -> dict[str, Any] | None:
         """Return the coefficient as an attribute."""
         if self.available and self.coordinator.data:
             # Determine attribute key based on sensor type
@@ -415,13 +462,18 @@ class MareesFranceWaterTempSensor(MareesFranceBaseSensor):
     ) -> None:
         """Initialize the water temperature sensor."""
         super().__init__(coordinator, config_entry, "water_temp")
+        # (forecast list, sorted Unix times, matching temperatures) of the last
+        # parsed forecast list.
+        self._water_temp_cache: (
+            tuple[list[dict[str, Any]], array[int], array[float]] | None
+        ) = None
 
     @property
     def _sensor_data(self) -> dict[str, Any] | None:
         """Helper to get the 'now_data' block from the coordinator."""
         if not self.coordinator.data:
             return None
-        return cast(dict[str, Any] | None, self.coordinator.data.get("now_data"))
+        return self.coordinator.data.get("now_data")
 
     @property
     def available(self) -> bool:
@@ -434,17 +486,37 @@ class MareesFranceWaterTempSensor(MareesFranceBaseSensor):
     @property
     def native_value(self) -> float | None:
         """Return the current water temperature from the hourly forecast."""
-        if not self.available or not self.coordinator.data:
+        # Same checks as `available`, without reading the coordinator data twice.
+        data = self.coordinator.data
+        if not data:
             return None
-
-        water_temp_data = self.coordinator.data.get("water_temp_data", [])
+        water_temp_data = data.get("water_temp_data")
         if not water_temp_data:
             return None
 
-        now_utc = dt_util.utcnow()
-        latest_temp = None
+        cached = self._water_temp_cache
+        if cached is None or cached[0] is not water_temp_data:
+            cached = (water_temp_data, *self._parse_forecasts(water_temp_data))
+            self._water_temp_cache = cached
+        _, forecast_times, forecast_temps = cached
+
+        # Most recent temperature forecast that is not in the future
+        index = bisect.bisect_right(forecast_times, dt_util.utcnow().timestamp()) - 1
+        return forecast_temps[index] if index >= 0 else None
 
-        # Find the most recent temperature forecast that is not in the future
+    @staticmethod
+    def _parse_forecasts(
+        water_temp_data: list[dict[str, Any]],
+    ) -> tuple[array[int], array[float]]:
+        """Parse the forecasts into Unix times and temperatures sorted by time.
+
+        Args:
+            water_temp_data: The hourly forecasts, `[{"datetime": ..., "temp": ...}]`.
+
+        Returns:
+            A tuple of the forecast Unix times and the matching temperatures.
+        """
+        forecasts: list[tuple[int, float]] = []
         for forecast in water_temp_data:
             forecast_time_str = forecast.get("datetime")
             temp_value = forecast.get("temp")
@@ -453,21 +525,22 @@ class MareesFranceWaterTempSensor(MareesFranceBaseSensor):
                 continue
 
             try:
-                forecast_time = dt_util.parse_datetime(forecast_time_str)
-                if forecast_time <= now_utc:
-                    latest_temp = float(temp_value)
-                else:
-                    # Stop when we reach future forecasts
-                    break
+                forecast_time = _parse_forecast_time(forecast_time_str)
+                if forecast_time is None or forecast_time.tzinfo is None:
+                    raise ValueError("no timezone")
+                forecasts.append((int(forecast_time.timestamp()), float(temp_value)))
             except (ValueError, TypeError):
                 _LOGGER.warning(
                     "Could not parse water temperature data: time=%s, temp=%s",
                     forecast_time_str,
                     temp_value,
                 )
-                continue
+        forecasts.sort(key=lambda forecast: forecast[0])
 
-        return latest_temp
+        return (
+            array("q", [forecast[0] for forecast in forecasts]),
+            array("d", [forecast[1] for forecast in forecasts]),
+        )
 
     async def async_added_to_hass(self) -> None:
         """Request a refresh when added to hass."""
@@ -475,8 +548,7 @@ class MareesFranceWaterTempSensor(MareesFranceBaseSensor):
         if self.native_value is None:
             await self.coordinator.async_request_refresh()
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _build_extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional attributes like current height and tide trend."""
         if self.available and self.coordinator.data:
             now_data = self.coordinator.data.get("now_data", {})
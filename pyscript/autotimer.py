@@ -1,4 +1,6 @@
-from datetime import datetime
+import heapq
+import math
+import time
 
 """
 AutoTimer – Pyscript Internals (Technical View)
@@ -16,8 +18,14 @@ STATESTR = "pyscript.autotimer_status"
 - All per-device timer data is stored in the entity attributes.
 
 TICK_SEC = 1
-- Timer resolution in seconds.
-- Each tick reduces remaining time by 1 second.
+- Display resolution in seconds.
+- While timers run, remaining_sec is republished at most this often.
+
+FLUSH_DELAY_SEC = 0.1
+- Debounce window for store and STORE_FILE writes triggered by services.
+
+STORE_FILE = "/config/pyscript/.autotimer.json"
+- On-disk copy of the store that survives a Home Assistant restart.
 
 
 Internal Store Model
@@ -39,6 +47,13 @@ The internal store is a dictionary keyed by entity_id:
 
 This store is written into the attributes of pyscript.autotimer_status.
 
+The runtime works on an in-memory copy of the store (_STORE). It is read
+from the attributes only once, on first use after startup or reload.
+
+Expiry is driven by _DEADLINES (entity_id → time.monotonic() deadline),
+which only holds running timers and is never published. remaining_sec
+is derived from it; it is not counted down.
+
 
 load_store()
 ------------
@@ -51,24 +66,69 @@ Key behavior:
 - Prevents recursive attribute corruption or invalid keys.
 
 
+_get_store()
+------------
+Returns the in-memory store, loading it with load_store() on first use.
+All services and the tick mutate this dict directly.
+
+
 save_store(store)
 -----------------
 Writes the store back into pyscript.autotimer_status.
 
 Behavior:
 - Sets the entity state to the current time (HH:MM:SS).
-- Writes the full store as attributes.
+- Writes a copy of the full store as attributes, so later in-memory
+  changes never leak into the published state without a write.
 - This guarantees UI updates and dashboard refreshes.
 
 
+_flush()
+--------
+Publishes the in-memory store with save_store(), but only if a change
+was marked with _DIRTY since the last write.
+
+
+_mark_dirty()
+-------------
+Used by the services instead of writing directly.
+Sets _DIRTY and schedules one _flush() FLUSH_DELAY_SEC (100 ms) later,
+so e.g. a scene switching ten AutoTimer lights at once ends up as a
+single attribute write instead of ten.
+Also calls _mark_persist(), so the change reaches STORE_FILE.
+
+
+_mark_persist()
+---------------
+Schedules one _persist() FLUSH_DELAY_SEC later, debounced like
+_mark_dirty() but without setting _DIRTY. Used where the status was
+already published (expiries in the tick, timers that expired during a
+restart) and only STORE_FILE still lags behind.
+
+
+_persist() / STORE_FILE
+-----------------------
+Writes default_sec per entity and, for running timers, the wall-clock
+expiry (expires_at) to STORE_FILE. File I/O runs in the executor
+(@pyscript_executor) and the file is replaced atomically.
+
+Only service changes and expiries persist, never the per-second
+countdown. The status attributes stay the live view for the dashboard,
+since pyscript states do not survive a restart.
+
+
 autotimer_init (startup trigger)
 --------------------------------
 Executed once at Home Assistant startup or reload.
 
 Behavior:
 - Ensures pyscript.autotimer_status exists.
-- Initializes an empty store if missing.
-- Does not overwrite existing data.
+- If missing (HA restart), rebuilds the store from STORE_FILE,
+  or starts with an empty store. Entries that are not dicts are
+  skipped, like in load_store().
+- Does not overwrite existing data (pyscript reload).
+- Re-arms timers that were still active.
+- Turns OFF entities whose timer expired while HA was down.
 
 
 autotimer_register_defaults (service)
@@ -108,7 +168,7 @@ autotimer_start (service)
 Starts or restarts a timer for one entity.
 
 Logic:
-1. Load store
+1. Get the in-memory store
 2. Verify entity has a registered default_sec
 3. Read helper override
 4. If override > 0:
@@ -119,8 +179,9 @@ Logic:
 5. Set:
      - remaining_sec
      - active = True
-6. Save store
-7. Turn the entity ON
+6. Arm the deadline (wakes the scheduler)
+7. Mark the store dirty (debounced flush)
+8. Turn the entity ON
 
 Important:
 - No time parameter is required.
@@ -134,22 +195,37 @@ Stops a running timer and turns the entity off.
 Behavior:
 - remaining_sec → 0
 - active → False
+- Deadline is dropped
 - Device is switched OFF
-- Store is saved immediately
-
-
-autotimer_tick (time trigger)
------------------------------
-Runs once per second (cron-based).
-
-Behavior:
-- Iterates over all stored entities
-- Only processes entries where active == True
-- Decrements remaining_sec
-- When remaining_sec reaches 0:
-    - active → False
-    - entity is turned OFF
-- Writes updated store only if something changed
+- Store is flushed with the next debounced write
+
+
+autotimer_tick / _run_scheduler
+-------------------------------
+Deadline-driven, no cron trigger.
+
+_arm() records the deadline in _DEADLINES, pushes (deadline, entity_id)
+onto the _HEAP min-heap and starts _run_scheduler as a task.
+task.unique() replaces a scheduler that is already sleeping, so a new
+or earlier deadline is picked up immediately.
+
+autotimer_tick() does one step:
+- Returns right away when _DEADLINES is empty
+- Only looks at entries in _DEADLINES (no attribute read per tick)
+- Pops due deadlines from _HEAP; entries whose timer was stopped or
+  restarted no longer match _DEADLINES and are dropped (lazy deletion)
+- For each due timer:
+    - remaining_sec → 0, active → False
+    - entity is collected for switching OFF
+- Sets remaining_sec of the running timers from their deadline; a step
+  that does not change any displayed second writes nothing
+- Turns all expired entities OFF with a single
+  homeassistant.turn_off call (entity_id list)
+- Returns the delay until the next step: the next display second or
+  the heap top, whichever comes first; None when nothing runs
+
+The scheduler sleeps for that delay and ends when no timer is active,
+so an idle AutoTimer causes no wakeups at all.
 
 This is the core countdown engine.
 
@@ -190,6 +266,19 @@ Design Summary
 
 STATESTR = "pyscript.autotimer_status"
 TICK_SEC = 1
+FLUSH_DELAY_SEC = 0.1
+STORE_FILE = "/config/pyscript/.autotimer.json"
+
+# In-memory Store, wird nur einmal aus den Attributen gelesen
+_STORE = None
+_DIRTY = False
+_FLUSH_PENDING = False
+_PERSIST_PENDING = False
+
+# monotone Ablaufzeitpunkte der aktiven Timer: entity_id → time.monotonic()
+_DEADLINES = {}
+# Min-Heap (deadline, entity_id); veraltete Einträge werden beim Pop verworfen
+_HEAP = []
 
 
 def load_store():
@@ -198,24 +287,161 @@ def load_store():
         return {}
 
     # 🔒 nur echte Entity-Einträge übernehmen
+    d = dict
     return {
         k: v for k, v in attrs.items()
-        if isinstance(v, dict)
+        if type(v) is d
         and "remaining_sec" in v
     }
 
 
+def _get_store():
+    global _STORE
+    if _STORE is None:
+        _STORE = load_store()
+    return _STORE
+
+
 def save_store(store):
-    ts = datetime.now().strftime("%H:%M:%S")
-    state.set(STATESTR, ts, store)
+    ts = time.strftime("%H:%M:%S")
+    # Kopie der Einträge: der In-Memory-Store darf den State nicht mitverändern
+    state.set(STATESTR, ts, {k: dict(v) for k, v in store.items()})
+
+
+def _flush():
+    global _DIRTY
+    if not _DIRTY:
+        return
+    _DIRTY = False
+    save_store(_get_store())
+
+
+@pyscript_executor
+def _read_store_file(path):
+    # native Python im Executor: Imports lokal halten
+    import json
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+@pyscript_executor
+def _write_store_file(path, data):
+    import json
+    import os
+
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def _persist():
+    # Laufzeiten als Wanduhr-Ablaufzeit sichern, damit sie einen Neustart überstehen
+    offset = time.time() - time.monotonic()
+    data = {}
+    for entity, entry in _get_store().items():
+        item = {"default_sec": entry.get("default_sec", 0)}
+        deadline = _DEADLINES.get(entity)
+        if deadline is not None:
+            item["expires_at"] = deadline + offset
+        data[entity] = item
+
+    try:
+        _write_store_file(STORE_FILE, data)
+    except OSError as e:
+        log.warning(f"AutoTimer: {STORE_FILE} nicht geschrieben: {e}")
+
+
+def _store_from_file(saved):
+    # liefert (store, während des Neustarts abgelaufene entity_ids)
+    store = {}
+    expired = []
+    if type(saved) is not dict:
+        return store, expired
+
+    now = time.time()
+    for entity, item in saved.items():
+        # 🔒 nur echte Entity-Einträge übernehmen, wie in load_store()
+        if type(item) is not dict:
+            continue
+
+        default_sec = item.get("default_sec", 0)
+        if type(default_sec) is not int:
+            default_sec = 0
+
+        expires_at = item.get("expires_at")
+        left = 0
+        if type(expires_at) in (int, float):
+            left = math.ceil(expires_at - now)
+            if left <= 0:
+                expired.append(entity)
+
+        store[entity] = {
+            "default_sec": default_sec,
+            "remaining_sec": max(0, left),
+            "active": left > 0,
+        }
+    return store, expired
+
+
+def _deferred_flush():
+    global _FLUSH_PENDING
+    task.sleep(FLUSH_DELAY_SEC)
+    _FLUSH_PENDING = False
+    _flush()
+
+
+def _deferred_persist():
+    global _PERSIST_PENDING
+    task.sleep(FLUSH_DELAY_SEC)
+    _PERSIST_PENDING = False
+    _persist()
+
+
+def _mark_persist():
+    # nur STORE_FILE nachziehen, ohne den Status erneut zu veröffentlichen
+    global _PERSIST_PENDING
+    if _PERSIST_PENDING:
+        return
+    _PERSIST_PENDING = True
+    task.create(_deferred_persist)
+
+
+def _mark_dirty():
+    # Änderungen innerhalb von FLUSH_DELAY_SEC zu einem Schreibvorgang bündeln
+    global _DIRTY, _FLUSH_PENDING
+    _DIRTY = True
+    _mark_persist()
+    if _FLUSH_PENDING:
+        return
+    _FLUSH_PENDING = True
+    task.create(_deferred_flush)
 
 
 @time_trigger("startup")
 def autotimer_init():
+    global _STORE
+    expired = []
     if state.get(STATESTR) is None:
-        save_store({})
+        # nach einem HA-Neustart: Datei ist die Quelle, sonst leer beginnen
+        _STORE, expired = _store_from_file(_read_store_file(STORE_FILE))
+        save_store(_STORE)
         log.info("AutoTimer: initialisiert")
 
+    # laufende Timer mit ihrer Restzeit wieder einplanen
+    for entity, entry in _get_store().items():
+        if entry.get("active") and entry.get("remaining_sec", 0) > 0:
+            _arm(entity, entry["remaining_sec"])
+
+    # während des Neustarts abgelaufene Timer nachholen
+    if expired:
+        _mark_persist()
+        service.call("homeassistant", "turn_off", entity_id=expired)
+
 
 @service
 def autotimer_register_defaults(devices=None):
@@ -229,8 +455,8 @@ def autotimer_register_defaults(devices=None):
     if not devices:
         return
 
-    store = load_store()
-    devices = list(devices)  # Wrapper → list
+    store = _get_store()
+    devices = tuple(devices)  # Wrapper → tuple, nur einmal durchlaufen
 
     for d in devices:
         entity = d.get("entity")
@@ -239,12 +465,20 @@ def autotimer_register_defaults(devices=None):
         if not entity or not minutes:
             continue
 
-        store.setdefault(entity, {})
-        store[entity]["default_sec"] = int(minutes) * 60
-        store[entity].setdefault("remaining_sec", 0)
-        store[entity].setdefault("active", False)
-
-    save_store(store)
+        # Eintrag in einem Schritt aufbauen, laufende Werte bleiben erhalten
+        cur = store.get(entity)
+        if cur is None:
+            store[entity] = {
+                "default_sec": int(minutes) * 60,
+                "remaining_sec": 0,
+                "active": False,
+            }
+        else:
+            cur["default_sec"] = int(minutes) * 60
+            cur.setdefault("remaining_sec", 0)
+            cur.setdefault("active", False)
+
+    _mark_dirty()
     log.info("AutoTimer: defaults registriert")
 
 
@@ -262,7 +496,7 @@ def autotimer_start(entity_id=None):
     if not entity_id:
         return
 
-    store = load_store()
+    store = _get_store()
     entry = store.get(entity_id)
 
     if not entry or "default_sec" not in entry:
@@ -278,8 +512,9 @@ def autotimer_start(entity_id=None):
 
     entry["remaining_sec"] = remaining
     entry["active"] = True
+    _arm(entity_id, remaining)
 
-    save_store(store)
+    _mark_dirty()
     service.call("homeassistant", "turn_on", entity_id=entity_id)
 
 
@@ -289,41 +524,98 @@ def autotimer_stop(entity_id=None):
     if not entity_id:
         return
 
-    store = load_store()
+    store = _get_store()
     entry = store.get(entity_id)
     if not entry:
         return
 
     entry["remaining_sec"] = 0
     entry["active"] = False
+    _disarm(entity_id)
 
-    save_store(store)
+    _mark_dirty()
     service.call("homeassistant", "turn_off", entity_id=entity_id)
 
 
-# @time_trigger("period(0:00:05)")
-@time_trigger("cron(* * * * * *)")
+def _arm(entity, seconds):
+    # Ablaufzeitpunkt merken und den Scheduler neu planen lassen
+    deadline = time.monotonic() + seconds
+    _DEADLINES[entity] = deadline
+    heapq.heappush(_HEAP, (deadline, entity))
+    task.create(_run_scheduler)
+
+
+def _disarm(entity):
+    # der Scheduler beendet sich selbst, sobald keine Deadline mehr offen ist
+    _DEADLINES.pop(entity, None)
+
+
 def autotimer_tick():
-    log.debug("AutoTimer TICK")
-    store = load_store()
-    changed = False
+    global _DIRTY
+    # kein aktiver Timer (z. B. letzter gerade gestoppt) → nichts zu tun
+    if not _DEADLINES:
+        _HEAP.clear()
+        return None
+
+    store = _get_store()
+    now = time.monotonic()
+    to_off = []
+
+    # fällige Deadlines vom Heap holen, gestoppte/neu gestartete überspringen
+    while _HEAP and _HEAP[0][0] <= now:
+        deadline, entity = heapq.heappop(_HEAP)
+        if _DEADLINES.get(entity) != deadline:
+            continue
 
-    for entity, entry in store.items():
-        if not entry.get("active"):
+        del _DEADLINES[entity]
+        entry = store.get(entity)
+        if entry is None or not entry.get("active"):
             continue
 
-        entry["remaining_sec"] -= 1
+        entry["remaining_sec"] = 0
+        entry["active"] = False
+        to_off.append(entity)
+        _DIRTY = True
+
+    for entity, deadline in list(_DEADLINES.items()):
+        entry = store.get(entity)
+        if entry is None or not entry.get("active"):
+            del _DEADLINES[entity]
+            continue
+
+        # nur schreiben, wenn sich die angezeigte Sekunde geändert hat
+        remaining = math.ceil(deadline - now)
+        if entry["remaining_sec"] != remaining:
+            entry["remaining_sec"] = remaining
+            _DIRTY = True
+
+    _flush()
+
+    # alle abgelaufenen Geräte mit einem einzigen Service-Call ausschalten
+    if to_off:
+        log.debug(f"AutoTimer EXPIRED → {to_off}")
+        _mark_persist()  # Ablauf auch in STORE_FILE festhalten
+        service.call("homeassistant", "turn_off", entity_id=to_off)
+
+    if not _DEADLINES:
+        _HEAP.clear()
+        return None
 
-        if entry["remaining_sec"] <= 0:
-            entry["remaining_sec"] = 0
-            entry["active"] = False
-            service.call("homeassistant", "turn_off", entity_id=entity)
+    while _DEADLINES.get(_HEAP[0][1]) != _HEAP[0][0]:
+        heapq.heappop(_HEAP)
 
-        changed = True
+    # bis zur nächsten Sekundenanzeige bzw. zum nächsten Ablauf schlafen
+    next_in = _HEAP[0][0] - time.monotonic()
+    return max(0, min(TICK_SEC, next_in))
 
-    if changed:
-        save_store(store)
 
+def _run_scheduler():
+    # ersetzt einen laufenden Scheduler, damit neue Deadlines sofort zählen
+    task.unique("autotimer_scheduler")
+    delay = autotimer_tick()
+    while delay is not None:
+        task.sleep(delay)
+        delay = autotimer_tick()
 
 
 @service
@@ -331,7 +623,7 @@ def autotimer_manual_event(entity_id=None, new_state=None):
     if not entity_id or new_state not in ("on", "off"):
         return
 
-    store = load_store()
+    store = _get_store()
     entry = store.get(entity_id)
     if not entry:
         return
@@ -340,12 +632,14 @@ def autotimer_manual_event(entity_id=None, new_state=None):
     if new_state == "on" and not entry.get("active"):
         entry["remaining_sec"] = entry["default_sec"]
         entry["active"] = True
-        save_store(store)
+        _arm(entity_id, entry["default_sec"])
+        _mark_dirty()
         log.info(f"AutoTimer MANUAL ON → {entity_id}")
 
     # Manuell AUS → Timer stoppen
     elif new_state == "off" and entry.get("active"):
         entry["remaining_sec"] = 0
         entry["active"] = False
-        save_store(store)
+        _disarm(entity_id)
+        _mark_dirty()
         log.info(f"AutoTimer MANUAL OFF → {entity_id}")
\ No newline at end of file
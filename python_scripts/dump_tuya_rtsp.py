@@ -1,10 +1,16 @@
-tuya = [e for e in hass.config_entries.async_entries("tuya") if e.state == "loaded"][0]
-manager = tuya.runtime_data.manager
+# erster geladener Tuya-Eintrag, Suche endet beim ersten Treffer
+tuya = None
+for entry in hass.config_entries.async_entries("tuya"):
+    if entry.state == "loaded":
+        tuya = entry
+        break
 
-for dev_id, dev in manager.device_map.items():
-    if "camera" in dev.category.lower():
-        url = manager.get_device_stream_allocate(dev.id, "rtsp")
-        logger.warning(f"{dev.name}: {url}")
+if tuya is None:
+    logger.warning("no loaded tuya config entry")
+else:
+    manager = tuya.runtime_data.manager
 
-
-        
\ No newline at end of file
+    for dev_id, dev in manager.device_map.items():
+        if "camera" in dev.category.lower():
+            url = manager.get_device_stream_allocate(dev.id, "rtsp")
+            logger.warning(f"{dev.name}: {url}")
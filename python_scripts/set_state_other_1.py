@@ -22,17 +22,24 @@ else:
   data = data.copy()
   inputEntity = data.pop('entity_id')
   inputStateObject = hass.states.get(inputEntity)
-  if inputStateObject:
+  if 'state' in data:
+    inputState = data.pop('state')
+  elif inputStateObject:
     inputState = inputStateObject.state
-    inputAttributesObject = inputStateObject.attributes.copy()
   else:
     inputState = 'unknown'
-    inputAttributesObject = {}
-  if 'state' in data:
-    inputState = data.pop('state')
   logger.debug("===== new attrs: {}".format(data))
-  inputAttributesObject.update(data)
+  # merge old and new attributes in one pass (no copy + update)
+  if inputStateObject:
+    inputAttributesObject = {**inputStateObject.attributes, **data}
+  else:
+    inputAttributesObject = data
 
-  hass.states.set(inputEntity, inputState, inputAttributesObject)
+  # nothing changed -> no write, no state_changed event
+  if (inputStateObject and inputState == inputStateObject.state
+      and inputAttributesObject == inputStateObject.attributes):
+    logger.debug("===== unchanged: {}".format(inputEntity))
+  else:
+    hass.states.set(inputEntity, inputState, inputAttributesObject)
 
         
\ No newline at end of file